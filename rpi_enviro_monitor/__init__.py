@@ -1,7 +1,47 @@
-# flake8: noqa: F401, F403
-# isort: skip_file
-from .config import load_config
-from .display import Display
-from .mqtt import MQTTClient
-from .sensors import *
-from .enviro import Enviro
+# Hardware-dependent modules (display and sensor drivers) are imported on first access, so that
+# other modules (like calibration) can be used without them installed
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .calibration import Calibration, fit_calibration
+    from .config import load_config
+    from .display import Display
+    from .enviro import Enviro
+    from .mqtt import MQTTClient
+    from .sensors import (
+        TREND_WINDOWS,
+        HumiditySensor,
+        LightSensor,
+        NoiseSensor,
+        PressureSensor,
+        ProximitySensor,
+        Sensor,
+        TemperatureSensor,
+        TrendHistory,
+    )
+
+_LAZY_IMPORTS = {
+    'Calibration': '.calibration',
+    'fit_calibration': '.calibration',
+    'load_config': '.config',
+    'Display': '.display',
+    'MQTTClient': '.mqtt',
+    'Sensor': '.sensors',
+    'HumiditySensor': '.sensors',
+    'PressureSensor': '.sensors',
+    'TemperatureSensor': '.sensors',
+    'LightSensor': '.sensors',
+    'ProximitySensor': '.sensors',
+    'NoiseSensor': '.sensors',
+    'TREND_WINDOWS': '.sensors',
+    'TrendHistory': '.sensors',
+    'Enviro': '.enviro',
+}
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        return getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
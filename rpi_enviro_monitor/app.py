@@ -17,6 +17,12 @@ def publish_loop(enviro):
         sleep(enviro.mqtt.interval)
 
 
+def sample_loop(enviro):
+    while True:
+        enviro.sample()
+        sleep(enviro.trend_interval)
+
+
 def run():
     enviro = Enviro()
 
@@ -25,6 +31,10 @@ def run():
         publish_thread = Thread(target=publish_loop, args=(enviro,), daemon=True)
         publish_thread.start()
 
+    # Sample all sensors in the background so long-term trends are kept up to date
+    sample_thread = Thread(target=sample_loop, args=(enviro,), daemon=True)
+    sample_thread.start()
+
     # Run display loop in main thread
     try:
         display_loop(enviro)
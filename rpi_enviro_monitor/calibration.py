@@ -0,0 +1,158 @@
+"""Per-device sensor calibration, loaded from the ``calibration`` section of the config file.
+
+Each metric may define any of the following, which are compiled into a single correction function:
+
+* ``gain`` and ``offset``: Linear correction, applied as ``value * gain + offset``
+* ``polynomial``: Polynomial coefficients, highest power first (as returned by ``numpy.polyfit``)
+* ``points``: Piecewise-linear lookup table, as a list of ``[raw, corrected]`` pairs. Values
+  outside the table are linearly extrapolated from the first or last segment.
+
+``temperature`` also accepts ``cpu_factor``, the CPU temperature compensation factor used by
+:py:class:`.TemperatureSensor`.
+
+Example:
+
+.. code-block:: yaml
+
+    calibration:
+      temperature:
+        cpu_factor: 2.25
+        offset: -0.4
+      humidity:
+        points: [[0, 0], [50, 47.5], [100, 98]]
+
+Coefficients can be derived from stored reference traces with the ``enviro-calibrate`` command.
+"""
+from argparse import ArgumentParser
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+from loguru import logger
+from yaml import safe_dump
+
+ArrayOrFloat = Union[np.ndarray, float]
+CALIBRATION_KEYS = ('offset', 'gain', 'polynomial', 'points')
+
+
+class Calibration:
+    """A compiled correction function for a single sensor metric. Gain and offset are folded into
+    the polynomial coefficients or lookup table, so each correction is a single ``numpy.polyval``
+    or ``numpy.interp`` call, which works on either a single value or an array of values.
+
+    Args:
+        offset: Value to add after all other corrections
+        gain: Value to multiply by before adding offset
+        polynomial: Polynomial coefficients, highest power first
+        points: ``[raw, corrected]`` pairs for piecewise-linear interpolation and extrapolation
+    """
+
+    def __init__(
+        self,
+        offset: float = 0.0,
+        gain: float = 1.0,
+        polynomial: Optional[Sequence[float]] = None,
+        points: Optional[Sequence[Sequence[float]]] = None,
+    ):
+        if polynomial is not None and points is not None:
+            raise ValueError('Only one of polynomial or points may be specified')
+
+        self.xp: Optional[np.ndarray] = None
+        self.fp: Optional[np.ndarray] = None
+        self.slopes: Optional[Tuple[float, float]] = None
+        self.coefs: Optional[np.ndarray] = None
+
+        if points is not None:
+            table = np.array(points, dtype=float)
+            if table.ndim != 2 or table.shape[1] != 2 or len(table) < 2:
+                raise ValueError('Calibration points must be at least two [raw, corrected] pairs')
+            table = table[np.argsort(table[:, 0])]
+            if (np.diff(table[:, 0]) == 0).any():
+                raise ValueError('Calibration points must not contain duplicate raw values')
+            self.xp = table[:, 0]
+            self.fp = table[:, 1] * gain + offset
+            slopes = np.diff(self.fp) / np.diff(self.xp)
+            self.slopes = (slopes[0], slopes[-1])
+        else:
+            coefs = np.array(polynomial if polynomial is not None else [1.0, 0.0], dtype=float)
+            if coefs.ndim != 1 or len(coefs) < 1:
+                raise ValueError('Calibration polynomial must have at least one coefficient')
+            self.coefs = coefs * gain
+            self.coefs[-1] += offset
+
+    @classmethod
+    def from_config(cls, config: Optional[dict]) -> Optional['Calibration']:
+        """Compile a calibration from a config section, or return ``None`` if there is nothing to
+        correct. Unknown keys are ignored, with a warning.
+        """
+        config = config or {}
+        unknown_keys = [k for k in config if k not in CALIBRATION_KEYS]
+        if unknown_keys:
+            logger.warning(f'Ignoring unknown calibration settings: {unknown_keys}')
+        kwargs = {k: v for k, v in config.items() if k in CALIBRATION_KEYS}
+        return cls(**kwargs) if kwargs else None
+
+    def __call__(self, values: ArrayOrFloat) -> ArrayOrFloat:
+        if self.xp is not None:
+            # np.interp clamps to the end values, so add linear extrapolation beyond each end
+            low_slope, high_slope = self.slopes  # type: ignore
+            return (
+                np.interp(values, self.xp, self.fp)  # type: ignore
+                + np.minimum(np.subtract(values, self.xp[0]), 0) * low_slope
+                + np.maximum(np.subtract(values, self.xp[-1]), 0) * high_slope
+            )
+        return np.polyval(self.coefs, values)  # type: ignore
+
+    def __repr__(self):
+        if self.xp is not None:
+            return f'Calibration(points={np.column_stack((self.xp, self.fp)).tolist()})'
+        return f'Calibration(polynomial={self.coefs.tolist()})'  # type: ignore
+
+
+def fit_calibration(raw: Sequence[float], reference: Sequence[float], degree: int = 1) -> dict:
+    """Fit polynomial calibration coefficients from a trace of raw sensor readings and
+    corresponding readings from a reference instrument.
+
+    Returns:
+        A config section for the metric, in the format ``{'polynomial': [...]}``
+    """
+    x, y = np.asarray(raw, dtype=float), np.asarray(reference, dtype=float)
+    if x.shape != y.shape or len(x) <= degree:
+        raise ValueError(f'Need at least {degree + 1} pairs of raw and reference values')
+
+    coefs = np.polyfit(x, y, degree)
+    residuals = y - np.polyval(coefs, x)
+    logger.info(f'Fit degree {degree} polynomial; RMS error: {np.sqrt(np.mean(residuals**2)):.3f}')
+    return {'polynomial': [round(float(c), 6) for c in coefs]}
+
+
+def load_trace(path: str) -> np.ndarray:
+    """Load a reference trace from a CSV file with columns ``raw,reference`` (and an optional
+    header row)
+    """
+    with open(path) as f:
+        first_value = f.readline().split(',')[0]
+    try:
+        float(first_value)
+        skiprows = 0
+    except ValueError:
+        skiprows = 1
+    return np.loadtxt(path, delimiter=',', skiprows=skiprows, ndmin=2)
+
+
+def main():
+    """Command-line tool to fit calibration coefficients from a stored reference trace, and print
+    the result as a config snippet. Raw readings should be recorded with calibration disabled.
+    """
+    parser = ArgumentParser(description=main.__doc__)
+    parser.add_argument('metric', help='Sensor metric name, e.g. "temperature"')
+    parser.add_argument('trace', help='CSV file with columns: raw,reference')
+    parser.add_argument('-d', '--degree', type=int, default=1, help='Polynomial degree')
+    args = parser.parse_args()
+
+    trace = load_trace(args.trace)
+    section = fit_calibration(trace[:, 0], trace[:, 1], degree=args.degree)
+    print(safe_dump({'calibration': {args.metric: section}}, default_flow_style=None))
+
+
+if __name__ == '__main__':
+    main()
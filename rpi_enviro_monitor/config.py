@@ -5,8 +5,9 @@ from loguru import logger
 from yaml import safe_load
 
 CONFIG_FILE = Path('~/.config/enviro.yml').expanduser()
+DEFAULT_TREND_INTERVAL = 5
 DEFAULT_CONFIG = {
-    'display': {'enabled': True, 'interval': 0.25},
+    'display': {'enabled': True, 'interval': 0.25, 'trend_interval': DEFAULT_TREND_INTERVAL},
     'mqtt': {'enabled': False},
 }
 
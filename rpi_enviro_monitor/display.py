@@ -3,6 +3,7 @@ from typing import List, Sequence, Tuple
 
 from fonts.ttf import RobotoMedium as UserFont
 from loguru import logger
+from numpy import isnan, nanmax, nanmin, ndarray
 from PIL import Image, ImageDraw, ImageFont
 from ST7735 import ST7735
 
@@ -80,6 +81,28 @@ class Display(ST7735):
         self._draw_text_bar(text)
         self._draw_frame()
 
+    def draw_envelope(self, text: str, mins: ndarray, maxs: ndarray, means: ndarray):
+        """Draw a min/max envelope graph, with one column per time bucket, and a colored
+        background based on the mean value. Empty buckets (``NaN``) are left blank.
+        """
+        self._new_frame(fill=BG_WHITE)
+        if not isnan(means).all():
+            vmin, vmax = nanmin(mins), nanmax(maxs)
+            for x, bucket in enumerate(zip(mins, maxs, means)):
+                if not isnan(bucket[2]):
+                    self._draw_envelope_value(x, *_normalize_range(bucket, vmin, vmax))
+        self._draw_text_bar(text)
+        self._draw_frame()
+
+    def _draw_envelope_value(self, x: float, vmin: float, vmax: float, mean: float):
+        """Draw a 1-pixel wide bar, colored based on relative mean value, with a black band
+        covering the range between min and max values
+        """
+        self.draw.rectangle((x, TOP_POS, x + 1, self.height), _value_to_rgb(mean))
+        top_y = self.height - (vmax * (self.height - TOP_POS))
+        bottom_y = self.height - (vmin * (self.height - TOP_POS))
+        self.draw.rectangle((x, top_y, x + 1, bottom_y + 1), fill=BG_BLACK)
+
     def _draw_graph_value(self, x: float, value: float):
         """Draw a 1-pixel wide bar, colored based on relative value, with a black pixel used to form
         a line graph
@@ -116,7 +139,11 @@ class Display(ST7735):
 
 def _normalize(values: Sequence[float]) -> List[float]:
     """Normalize the values between 0 and 1"""
-    vmin, vmax = min(values), max(values)
+    return _normalize_range(values, min(values), max(values))
+
+
+def _normalize_range(values: Sequence[float], vmin: float, vmax: float) -> List[float]:
+    """Normalize the values between 0 and 1, relative to a given range"""
     return [(v - vmin + 1) / (vmax - vmin + 1) for v in values]
 
 
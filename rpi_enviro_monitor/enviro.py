@@ -6,10 +6,12 @@ from typing import Optional
 
 from loguru import logger
 
-from .config import load_config
+from .calibration import Calibration
+from .config import DEFAULT_TREND_INTERVAL, load_config
 from .display import BG_CYAN, BG_RED, Display, RGBColor
 from .mqtt import MQTTClient
 from .sensors import (
+    TREND_WINDOWS,
     HumiditySensor,
     LightSensor,
     NoiseSensor,
@@ -24,6 +26,10 @@ N_EXTRA_MODES = 2
 MODE_DISPLAY_ALL = 0
 MODE_DISPLAY_STATUS = 1
 
+# Each sensor has one mode for live readings, plus one mode per long-term trend window
+TREND_LABELS = tuple(TREND_WINDOWS)
+N_SENSOR_MODES = 1 + len(TREND_LABELS)
+
 
 class Enviro:
     """Class that manages the Enviro's sensors, display, and (optionally) an MQTT client for sending
@@ -45,25 +51,65 @@ class Enviro:
         # Configure display
         display_interval = self.config['display']['interval']
         self.display = Display(interval=self.config['display']['interval'])
+        self.trend_interval = self.config['display'].get('trend_interval', DEFAULT_TREND_INTERVAL)
+        if self.trend_interval <= 0:
+            raise ValueError(f'Trend interval must be positive; got {self.trend_interval}')
 
         # Proximity sensor is used internally, but not directly displayed on screen
         self.proximity = ProximitySensor()
 
-        # Configure sensors
-        temp = TemperatureSensor(display_interval)
+        # Configure sensors, with per-device calibration if configured
+        calibration = self.config.get('calibration') or {}
+
+        def get_calibration(name: str) -> Optional[Calibration]:
+            return Calibration.from_config(calibration.get(name))
+
+        # CPU compensation factor is specific to temperature, so it's not part of Calibration
+        temp_calibration = dict(calibration.get('temperature') or {})
+        temp_kwargs = {}
+        if 'cpu_factor' in temp_calibration:
+            temp_kwargs['cpu_factor'] = temp_calibration.pop('cpu_factor')
+        temp = TemperatureSensor(
+            display_interval,
+            calibration=Calibration.from_config(temp_calibration),
+            **temp_kwargs,
+        )
+        self.noise = NoiseSensor(display_interval, calibration=get_calibration(NoiseSensor.name))
         self.sensors: tuple[Sensor] = (
             temp,
-            PressureSensor(display_interval, bme280=temp.bme280),
-            HumiditySensor(display_interval, bme280=temp.bme280),
-            LightSensor(display_interval, ltr559=self.proximity.ltr559),
-            NoiseSensor(display_interval),
+            PressureSensor(
+                display_interval,
+                bme280=temp.bme280,
+                calibration=get_calibration(PressureSensor.name),
+            ),
+            HumiditySensor(
+                display_interval,
+                bme280=temp.bme280,
+                calibration=get_calibration(HumiditySensor.name),
+            ),
+            LightSensor(
+                display_interval,
+                ltr559=self.proximity.ltr559,
+                calibration=get_calibration(LightSensor.name),
+            ),
+            self.noise,
         )
+        self._check_trend_interval()
 
         # Configure MQTT client, if enabled
         self.mqtt = None
         if self.config['mqtt'].get('enabled', False):
             self.mqtt = MQTTClient(self.device_id, config=self.config['mqtt'])
 
+    def _check_trend_interval(self):
+        """Warn if the trend interval is too long to fill every bucket of the shortest window"""
+        bucket_widths = [t.bucket_width for s in self.sensors for t in s.trends.values()]
+        if bucket_widths and self.trend_interval > min(bucket_widths):
+            logger.warning(
+                f'Trend interval ({self.trend_interval}s) is longer than the shortest trend bucket '
+                f'({min(bucket_widths)}s); trend graphs will have gaps'
+            )
+
     def check_mode(self):
         """Check if we have changed the display mode, by using the proximity sensor as a button"""
         if self.proximity.check_press():
@@ -72,7 +118,7 @@ class Enviro:
 
     def cycle_mode(self):
         """Switch to the next display mode"""
-        n_modes = len(self.sensors) + N_EXTRA_MODES
+        n_modes = len(self.sensors) * N_SENSOR_MODES + N_EXTRA_MODES
         self.mode += 1
         self.mode %= n_modes
         logger.info(f'Switched to mode {self.mode}')
@@ -88,9 +134,14 @@ class Enviro:
         sensor = self.get_active_sensor()
         if not sensor:
             return
+        label = self.get_active_trend()
         with self.lock:
             sensor.read()
-            self.display.draw_graph(sensor.status(), sensor.history)
+            if label:
+                trend = sensor.trends[label]
+                self.display.draw_envelope(sensor.trend_status(label), *trend.envelope())
+            else:
+                self.display.draw_graph(sensor.status(), sensor.history)
 
     def display_all(self) -> None:
         """Display all sensor readings"""
@@ -109,9 +160,16 @@ class Enviro:
 
     def get_active_sensor(self) -> Optional[Sensor]:
         """Get the currently selected sensor, if any"""
-        sensor_idx = self.mode - N_EXTRA_MODES
+        sensor_idx = (self.mode - N_EXTRA_MODES) // N_SENSOR_MODES
         return self.sensors[sensor_idx] if sensor_idx >= 0 else None
 
+    def get_active_trend(self) -> Optional[str]:
+        """Get the label of the currently selected trend window, if any (``None`` for live
+        readings)
+        """
+        trend_idx = (self.mode - N_EXTRA_MODES) % N_SENSOR_MODES - 1
+        return TREND_LABELS[trend_idx] if self.mode >= N_EXTRA_MODES and trend_idx >= 0 else None
+
     def publish(self):
         """Log and publish sensor data to MQTT, if enabled"""
         data = self.read_all_values()
@@ -119,6 +177,17 @@ class Enviro:
         if self.mqtt:
             self.mqtt.publish_json(data)
 
+    def sample(self):
+        """Refresh all sensor values and add them to long-term trends. The noise sensor has its own
+        lock and is read first, so its slow recording doesn't block the display.
+        """
+        self.noise.read()
+        with self.lock:
+            for sensor in self.sensors:
+                if sensor is not self.noise:
+                    sensor.read()
+                sensor.update_trends()
+
     def _read_all(self) -> list[float]:
         """Refresh and return all sensor values"""
         with self.lock:
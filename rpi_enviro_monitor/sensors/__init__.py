@@ -1,5 +1,30 @@
-# flake8: noqa: F401
-from .base import Sensor
-from .humidity import HumiditySensor, PressureSensor, TemperatureSensor
-from .light import LightSensor, ProximitySensor
-from .noise import NoiseSensor
+# Sensor modules are imported on first access, so that hardware-independent modules (like trend)
+# can be used without sensor drivers installed
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import Sensor
+    from .humidity import HumiditySensor, PressureSensor, TemperatureSensor
+    from .light import LightSensor, ProximitySensor
+    from .noise import NoiseSensor
+    from .trend import TREND_WINDOWS, TrendHistory
+
+_LAZY_IMPORTS = {
+    'Sensor': '.base',
+    'HumiditySensor': '.humidity',
+    'PressureSensor': '.humidity',
+    'TemperatureSensor': '.humidity',
+    'LightSensor': '.light',
+    'ProximitySensor': '.light',
+    'NoiseSensor': '.noise',
+    'TREND_WINDOWS': '.trend',
+    'TrendHistory': '.trend',
+}
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        return getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -2,12 +2,14 @@
 from abc import abstractmethod
 from collections import deque
 from time import time
-from typing import Tuple
+from typing import Dict, Optional, Sequence, Tuple
 
 from loguru import logger
 from numpy import digitize
 
+from ..calibration import Calibration
 from ..display import BLUE, CYAN, GREEN, RED, YELLOW, RGBColor
+from .trend import TREND_WINDOWS, TrendHistory
 
 # Default number of sensor readings to keep in history
 HISTORY_LEN = 160
@@ -28,16 +30,33 @@ class Sensor:
     Args:
         history_len: Number of sensor readings to keep in history
         min_interval: Minimum time between sensor readings, in seconds
+        trend_windows: Labels of long-term trend windows to keep (see ``TREND_WINDOWS``)
+        calibration: Correction to apply to raw sensor readings
     """
 
     name: str
     unit: str
     bins: Tuple[float, float, float, float]
     history: deque[float]
+    trends: Dict[str, TrendHistory]
+    calibration: Optional[Calibration]
 
-    def __init__(self, min_interval: float = 0.1, history_len: int = HISTORY_LEN):
+    def __init__(
+        self,
+        min_interval: float = 0.1,
+        history_len: int = HISTORY_LEN,
+        trend_windows: Sequence[str] = tuple(TREND_WINDOWS),
+        calibration: Optional[Calibration] = None,
+    ):
         logger.debug(f'Initializing {self.__class__.__name__}')
         self.history = deque([0] * history_len, maxlen=history_len)
+        self.trends = {
+            label: TrendHistory(TREND_WINDOWS[label], n_buckets=history_len)
+            for label in trend_windows
+        }
+        self.calibration = calibration
+        if calibration:
+            logger.debug(f'Using calibration for {self.name}: {calibration}')
         self.last_read = 0.0
         self.min_interval = min_interval
 
@@ -50,16 +69,26 @@ class Sensor:
         pass
 
     def read(self) -> float:
-        """Read the current sensor value. If the sensor has already been read within the minimum
-        interval, the previous reading will be used.
+        """Read the current sensor value, with calibration applied (if any). If the sensor has
+        already been read within the minimum interval, the previous reading will be used.
         """
         if not self.last_read or time() - self.last_read >= self.min_interval:
             self.last_read = time()
-            self.history.append(self.raw_read())
+            value = self.raw_read()
+            if self.calibration:
+                value = float(self.calibration(value))
+            self.history.append(value)
         else:
             logger.debug(f'Skipping read for {self.name}')
         return self.history[-1]
 
+    def update_trends(self):
+        """Add the latest reading to long-term trends. This should be called at a fixed interval
+        (rather than on every read), so each trend bucket is sampled at the same rate.
+        """
+        for trend in self.trends.values():
+            trend.add(self.value, self.last_read)
+
     def average(self) -> float:
         return sum(self.history) / len(self.history)
 
@@ -73,3 +102,7 @@ class Sensor:
     def status(self) -> str:
         """Get a status message to display"""
         return f'{self.name}: {self.value:.1f} {self.unit}'
+
+    def trend_status(self, label: str) -> str:
+        """Get a status message to display for a long-term trend graph"""
+        return f'{self.name} ({label}): {self.value:.1f} {self.unit}'
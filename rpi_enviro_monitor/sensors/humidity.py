@@ -59,9 +59,14 @@ class TemperatureSensor(Sensor):
     unit = 'C'
     bins = (4, 18, 28, 35)
 
-    def __init__(self, *args, bme280: BME280 = None, **kwargs):
+    def __init__(
+        self, *args, bme280: BME280 = None, cpu_factor: float = CPU_TEMP_FACTOR, **kwargs
+    ):
+        if cpu_factor <= 0:
+            raise ValueError(f'CPU temperature factor must be positive; got {cpu_factor}')
         super().__init__(*args, **kwargs)
-        self.cpu_temp = CPUTemperatureSensor(history_len=5)
+        self.cpu_factor = cpu_factor
+        self.cpu_temp = CPUTemperatureSensor(history_len=5, trend_windows=())
         self.bme280 = bme280 or BME280()
 
     def raw_read(self):
@@ -69,5 +74,5 @@ class TemperatureSensor(Sensor):
         self.cpu_temp.read()
         avg_cpu_temp = self.cpu_temp.average()
         raw_temp = self.bme280.get_temperature()
-        compensation = (avg_cpu_temp - raw_temp) / CPU_TEMP_FACTOR
+        compensation = (avg_cpu_temp - raw_temp) / self.cpu_factor
         return raw_temp - compensation
@@ -33,6 +33,7 @@ class ProximitySensor(Sensor):
     last_page: float
 
     def __init__(self, *args, ltr559: LTR559 = None, **kwargs):
+        kwargs.setdefault('trend_windows', ())
         super().__init__(*args, **kwargs)
         self.ltr559 = ltr559 or LTR559()
         self.last_page = time()
@@ -4,6 +4,8 @@ microphone, for basic use as an ambient noise sensor.
 
 Adapted from: https://github.com/pimoroni/enviroplus-python/blob/master/library/enviroplus/noise.py
 """
+from threading import Lock
+
 import numpy as np
 import sounddevice
 
@@ -24,6 +26,7 @@ class NoiseSensor(Sensor):
         """
         super().__init__(*args, **kwargs)
         self.duration = duration
+        self.lock = Lock()
         self.sample_rate = sample_rate
 
     def get_amplitude_at_frequency_range(self, start: int, end: int):
@@ -71,6 +74,13 @@ class NoiseSensor(Sensor):
 
         return amp_low, amp_mid, amp_high, amp_total
 
+    def read(self) -> float:
+        """Read the current noise level. Since recording is slow, this has its own lock, so it can
+        be read without holding the shared lock used for I2C sensors and the display.
+        """
+        with self.lock:
+            return super().read()
+
     def raw_read(self) -> float:
         measurements = self.get_noise_profile()
         return measurements[-1] * 128
@@ -0,0 +1,73 @@
+"""Fixed-size, streaming min/max/mean decimation of sensor readings, for displaying long-term trends
+(hours or days) with the same number of points as the live graph
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Trend windows to keep for each sensor, in the format ``{label: seconds}``
+TREND_WINDOWS = {
+    '1h': 60 * 60,
+    '24h': 60 * 60 * 24,
+    '7d': 60 * 60 * 24 * 7,
+}
+
+
+class TrendHistory:
+    """Ring buffer of time-aligned buckets, each holding the min, max, sum, and count of readings
+    within its time slice. Memory use is fixed, and each added reading is O(1).
+
+    Args:
+        window: Total time span covered by all buckets, in seconds
+        n_buckets: Number of buckets (one per display column, same as the Sensor history length)
+    """
+
+    def __init__(self, window: float, n_buckets: int):
+        self.window = window
+        self.n_buckets = n_buckets
+        self.bucket_width = window / n_buckets
+        self.current: Optional[int] = None  # Absolute index of the most recent bucket
+
+        self.mins = np.full(n_buckets, np.nan)
+        self.maxs = np.full(n_buckets, np.nan)
+        self.sums = np.zeros(n_buckets)
+        self.counts = np.zeros(n_buckets, dtype=int)
+
+    def add(self, value: float, timestamp: float):
+        """Add a sensor reading taken at the given (epoch) timestamp"""
+        bucket = int(timestamp // self.bucket_width)
+        if self.current is None:
+            self.current = bucket
+        elif bucket > self.current:
+            self._advance(bucket)
+        # If the clock went backwards, just add to the most recent bucket
+        idx = self.current % self.n_buckets
+
+        if self.counts[idx]:
+            self.mins[idx] = min(self.mins[idx], value)
+            self.maxs[idx] = max(self.maxs[idx], value)
+        else:
+            self.mins[idx] = self.maxs[idx] = value
+        self.sums[idx] += value
+        self.counts[idx] += 1
+
+    def _advance(self, bucket: int):
+        """Move to a new bucket, and clear any buckets skipped over (at most one full window)"""
+        n_skipped = min(bucket - self.current, self.n_buckets)  # type: ignore
+        cleared = np.arange(bucket - n_skipped + 1, bucket + 1) % self.n_buckets
+        self.mins[cleared] = np.nan
+        self.maxs[cleared] = np.nan
+        self.sums[cleared] = 0
+        self.counts[cleared] = 0
+        self.current = bucket
+
+    def envelope(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get ``(mins, maxs, means)`` per bucket, ordered from oldest to newest. Empty buckets
+        are ``NaN``.
+        """
+        shift = -((self.current or 0) + 1) % self.n_buckets
+        counts = np.roll(self.counts, shift)
+        sums = np.roll(self.sums, shift)
+        means = np.full(self.n_buckets, np.nan)
+        np.divide(sums, counts, out=means, where=counts > 0)
+        return np.roll(self.mins, shift), np.roll(self.maxs, shift), means
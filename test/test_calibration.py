@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from rpi_enviro_monitor.calibration import Calibration, fit_calibration, load_trace
+
+
+def test_default__identity():
+    calibration = Calibration()
+    assert calibration(12.5) == pytest.approx(12.5)
+
+
+def test_gain_offset__folded_into_polynomial():
+    calibration = Calibration(gain=2, offset=1, polynomial=[0.5, 3, 4])
+    assert calibration.coefs.tolist() == [1, 6, 9]
+    assert calibration(2) == pytest.approx(2 * (0.5 * 4 + 3 * 2 + 4) + 1)
+
+
+def test_gain_offset__folded_into_points():
+    calibration = Calibration(gain=2, offset=1, points=[[10, 20], [0, 0]])
+    assert calibration.xp.tolist() == [0, 10]
+    assert calibration.fp.tolist() == [1, 41]
+    assert calibration(5) == pytest.approx(21)
+
+
+def test_points__extrapolation():
+    calibration = Calibration(points=[[0, 0], [100, 110], [1000, 1050]])
+    values = calibration(np.array([-10, 50, 500, 5000]))
+    assert values == pytest.approx([-11, 55, 1050 - 500 * 940 / 900, 1050 + 4000 * 940 / 900])
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'polynomial': []},
+        {'points': [[0, 1]]},
+        {'points': [[1, 2], [1, 3]]},
+        {'polynomial': [1, 0], 'points': [[0, 0], [1, 1]]},
+    ],
+)
+def test_invalid(kwargs):
+    with pytest.raises(ValueError):
+        Calibration(**kwargs)
+
+
+def test_from_config():
+    assert Calibration.from_config(None) is None
+    assert Calibration.from_config({}) is None
+    assert Calibration.from_config({'offset': -0.5})(20) == pytest.approx(19.5)
+
+
+@pytest.mark.parametrize('config', [{'ofset': 1}, {'cpu_factor': 2}])
+def test_from_config__unknown_keys(config):
+    assert Calibration.from_config(config) is None
+
+
+def test_fit_calibration():
+    raw = np.array([10, 20, 30, 40])
+    section = fit_calibration(raw, raw * 1.05 + 0.5)
+    assert section['polynomial'] == pytest.approx([1.05, 0.5])
+    assert Calibration.from_config(section)(raw) == pytest.approx(raw * 1.05 + 0.5)
+
+
+def test_fit_calibration__too_few_values():
+    with pytest.raises(ValueError):
+        fit_calibration([1, 2], [1, 2], degree=2)
+
+
+@pytest.mark.parametrize('header', ['', 'raw,reference\n'])
+def test_load_trace(tmp_path, header):
+    trace_file = tmp_path / 'trace.csv'
+    trace_file.write_text(f'{header}10,11\n20,21.5\n')
+    trace = load_trace(str(trace_file))
+    assert trace.tolist() == [[10, 11], [20, 21.5]]
@@ -0,0 +1,60 @@
+import numpy as np
+
+from rpi_enviro_monitor.sensors.trend import TrendHistory
+
+
+def test_add__single_bucket():
+    trend = TrendHistory(window=10, n_buckets=10)
+    for value in [3, 1, 2]:
+        trend.add(value, 100.5)
+
+    mins, maxs, means = trend.envelope()
+    assert (mins[-1], maxs[-1], means[-1]) == (1, 3, 2)
+    assert np.isnan(means[:-1]).all()
+
+
+def test_add__rollover():
+    trend = TrendHistory(window=10, n_buckets=10)
+    for i in range(25):
+        trend.add(i, 100 + i)
+
+    mins, maxs, means = trend.envelope()
+    assert mins.tolist() == list(range(15, 25))
+    assert maxs.tolist() == list(range(15, 25))
+    assert means.tolist() == list(range(15, 25))
+
+
+def test_envelope__oldest_to_newest():
+    trend = TrendHistory(window=10, n_buckets=10)
+    trend.add(1, 103)
+    trend.add(2, 105)
+    trend.add(3, 107)
+
+    _, _, means = trend.envelope()
+    assert means[-1] == 3
+    assert means[-3] == 2
+    assert means[-5] == 1
+    assert np.isnan(means[:-5]).all()
+
+
+def test_add__gap_longer_than_window():
+    trend = TrendHistory(window=10, n_buckets=10)
+    for i in range(10):
+        trend.add(i, 100 + i)
+    trend.add(50, 1000)
+
+    mins, maxs, means = trend.envelope()
+    assert (mins[-1], maxs[-1], means[-1]) == (50, 50, 50)
+    assert np.isnan(means[:-1]).all()
+    assert np.isnan(mins[:-1]).all()
+    assert np.isnan(maxs[:-1]).all()
+
+
+def test_add__clock_backwards():
+    trend = TrendHistory(window=10, n_buckets=10)
+    trend.add(1, 105)
+    trend.add(5, 101)
+
+    mins, maxs, means = trend.envelope()
+    assert (mins[-1], maxs[-1], means[-1]) == (1, 5, 3)
+    assert np.isnan(means[:-1]).all()